@@ -1,12 +1,10 @@
-import redis.asyncio as redis
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi_limiter import FastAPILimiter
+from fastapi.responses import ORJSONResponse
 
 from src.routes import contacts, auth
-from src.conf.config import settings
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 origins = [
     "http://localhost:3000"
@@ -20,20 +18,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
 app.include_router(auth.router, prefix='/api')
 app.include_router(contacts.router, prefix='/api')
 
-@app.on_event("startup")
-async def startup():
-    """
-        Event handler that runs on application startup.
-
-        Initializes the Redis connection and sets up rate limiting.
-    """
-    r = await redis.Redis(host=settings.redis_host, port=settings.redis_port, db=0, encoding="utf-8",
-                          decode_responses=True)
-    await FastAPILimiter.init(r)
-
 
 @app.get("/")
 def read_root():
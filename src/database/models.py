@@ -1,7 +1,7 @@
 from sqlalchemy import Column, Integer, String, Boolean, func, Table, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql.schema import ForeignKey
-from sqlalchemy.sql.sqltypes import DateTime
+from sqlalchemy.sql.sqltypes import DateTime, Date
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
@@ -14,9 +14,9 @@ class Contact (Base):
     lastname = Column(String(100), nullable=False)
     email = Column(String(100), nullable=False)
     phone = Column(String(100), nullable=False)
-    birthdate = Column(String(100), nullable=False)
+    birthdate = Column(Date, nullable=False, index=True)
     additional_data = Column(String(200), default=False)
-    user_id = Column('user_id', ForeignKey('users.id', ondelete='CASCADE'), default=None)
+    user_id = Column('user_id', ForeignKey('users.id', ondelete='CASCADE'), default=None, index=True)
     user = relationship('User', backref="contacts")
 
 class User(Base):
@@ -29,4 +29,5 @@ class User(Base):
     avatar = Column(String(255), nullable=True)
     refresh_token = Column(String(255), nullable=True)
     confirmed = Column(Boolean, default=False)
+    contacts_version = Column(Integer, nullable=False, default=0, server_default="0")
 
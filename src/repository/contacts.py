@@ -1,82 +1,204 @@
 """Module to handle contact-related operations."""
 
+from datetime import date
 from typing import List
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+
+import orjson
+from sqlalchemy import select, insert, update, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload, raiseload
 from src.database.models import Contact, User
 from src.schemas import ContactBase, ContactResponse, UserModel, UserDb, UserResponse, TokenModel
+from src.services.cache import redis_client
+
+CONTACTS_CACHE_TTL = 60
+CACHED_CONTACT_FIELDS = ("id", "firstname", "lastname", "email", "phone", "birthdate", "additional_data", "user_id")
 
 
-async def get_contacts(skip: int, limit: int, user: User, db: Session) -> List[Contact]:
+async def cache_contacts(key: str, contacts: List[Contact], user: User) -> None:
+    """
+    Store a page of contacts in Redis and register its key for later invalidation.
+
+    Args:
+        key (str): The cache key of the page.
+        contacts (List[Contact]): The contacts to cache.
+        user (User): The owner of the contacts.
+    """
+    payload = orjson.dumps([{field: getattr(contact, field) for field in CACHED_CONTACT_FIELDS} for contact in contacts])
+    index_key = f"contacts:{user.id}:keys"
+    pipe = redis_client.pipeline(transaction=False)
+    pipe.set(key, payload, ex=CONTACTS_CACHE_TTL)
+    pipe.sadd(index_key, key)
+    pipe.expire(index_key, CONTACTS_CACHE_TTL)
+    await pipe.execute()
+
+
+async def invalidate_contacts_cache(user: User) -> None:
+    """
+    Drop every cached page of contacts for a user.
+
+    Args:
+        user (User): The user whose cached contacts are dropped.
+    """
+    index_key = f"contacts:{user.id}:keys"
+    keys = await redis_client.smembers(index_key)
+    await redis_client.delete(index_key, *keys)
+
+
+async def get_contacts(skip: int, limit: int, user: User, db: AsyncSession, version: int = None) -> List[Contact]:
     """
     Retrieve a list of contacts for a specific user.
 
+    Cached pages are keyed by the version of the user's contacts, so a page cached before a change is never
+    served once the change is committed, even if the invalidation has not run yet.
+
     Args:
         skip (int): The number of contacts to skip.
         limit (int): The maximum number of contacts to retrieve.
         user (User): The user for whom contacts are retrieved.
-        db (Session): The database session.
+        db (AsyncSession): The database session.
+        version (int, optional): The version from get_contacts_version, looked up when not given.
 
     Returns:
         List[Contact]: A list of contacts for the specified user.
     """
-    return db.query(Contact).filter(Contact.user_id == user.id).offset(skip).limit(limit).all()
+    if version is None:
+        version = await get_contacts_version(user, db)
+    key = f"contacts:{user.id}:{version}:{skip}:{limit}"
+    cached = await redis_client.get(key)
+    if cached is not None:
+        rows = orjson.loads(cached)
+        for row in rows:
+            row["birthdate"] = date.fromisoformat(row["birthdate"])
+        return [Contact(**row) for row in rows]
+    stmt = (
+        select(Contact)
+        .where(Contact.user_id == user.id)
+        .options(selectinload(Contact.user), raiseload("*"))
+        .offset(skip)
+        .limit(limit)
+    )
+    result = await db.execute(stmt)
+    contacts = result.scalars().all()
+    await cache_contacts(key, contacts, user)
+    return contacts
+
+
+async def get_contacts_version(user: User, db: AsyncSession) -> int:
+    """
+    Retrieve the version of a user's contacts.
+
+    Args:
+        user (User): The user whose contacts are inspected.
+        db (AsyncSession): The database session.
+
+    Returns:
+        int: A counter that grows with every committed change to the user's contacts.
+    """
+    stmt = select(User.contacts_version).where(User.id == user.id)
+    result = await db.execute(stmt)
+    return result.scalar_one()
 
 
-async def get_contact(contact_id: int, user: User, db: Session) -> Contact:
+async def bump_contacts_version(user: User, db: AsyncSession) -> None:
+    """
+    Increment the version of a user's contacts as part of the current transaction.
+
+    The UPDATE locks the user's row until the transaction ends, so concurrent writers bump the version one after
+    another and every committed change gets a higher version than the ones committed before it.
+
+    Args:
+        user (User): The user whose contacts changed.
+        db (AsyncSession): The database session.
+    """
+    stmt = update(User).where(User.id == user.id).values(contacts_version=User.contacts_version + 1)
+    await db.execute(stmt)
+
+
+async def get_contact(contact_id: int, user: User, db: AsyncSession) -> Contact:
     """
     Retrieve a specific contact for a user.
 
     Args:
         contact_id (int): The ID of the contact to retrieve.
         user (User): The user for whom the contact is retrieved.
-        db (Session): The database session.
+        db (AsyncSession): The database session.
 
     Returns:
         Contact: The specified contact for the user.
     """
-    return db.query(Contact).filter(and_(Contact.id == contact_id, Contact.user_id == user.id)).first()
+    stmt = select(Contact).where(Contact.id == contact_id, Contact.user_id == user.id)
+    result = await db.execute(stmt)
+    return result.scalar_one_or_none()
 
 
-async def create_contact(body: ContactBase, user: User, db: Session) -> Contact:
+async def create_contact(body: ContactBase, user: User, db: AsyncSession) -> Contact:
     """
     Create a new contact for a user.
 
     Args:
         body (ContactBase): The data for creating a new contact.
         user (User): The user for whom the contact is created.
-        db (Session): The database session.
+        db (AsyncSession): The database session.
 
     Returns:
         Contact: The newly created contact.
     """
-    contact = Contact(firstname=body.firstname, lastname=body.lastname, email=body.email, phone=body.phone, birthdate=body.birthdate, additional_data=body.additional_data, user_id=user.id)
-    db.add(contact)
-    db.commit()
-    db.refresh(contact)
+    stmt = insert(Contact).values(**body.model_dump(), user_id=user.id).returning(Contact)
+    result = await db.execute(stmt)
+    contact = result.scalar_one()
+    await bump_contacts_version(user, db)
+    await db.commit()
+    await invalidate_contacts_cache(user)
     return contact
 
 
-async def remove_contact(contact_id: int, user: User, db: Session) -> Contact | None:
+async def create_contacts_bulk(bodies: List[ContactBase], user: User, db: AsyncSession) -> List[Contact]:
+    """
+    Create several contacts for a user in a single INSERT and commit.
+
+    Args:
+        bodies (List[ContactBase]): The data for the new contacts.
+        user (User): The user for whom the contacts are created.
+        db (AsyncSession): The database session.
+
+    Returns:
+        List[Contact]: The newly created contacts, in the order of bodies.
+    """
+    if not bodies:
+        return []
+    rows = [body.model_dump() | {"user_id": user.id} for body in bodies]
+    result = await db.scalars(insert(Contact).returning(Contact, sort_by_parameter_order=True), rows)
+    contacts = result.all()
+    await bump_contacts_version(user, db)
+    await db.commit()
+    await invalidate_contacts_cache(user)
+    return contacts
+
+
+async def remove_contact(contact_id: int, user: User, db: AsyncSession) -> Contact | None:
     """
     Remove a contact for a user.
 
     Args:
         contact_id (int): The ID of the contact to remove.
         user (User): The user for whom the contact is removed.
-        db (Session): The database session.
+        db (AsyncSession): The database session.
 
     Returns:
         Contact | None: The removed contact or None if not found.
     """
-    contact = db.query(Contact).filter(and_(Contact.id == contact_id, Contact.user_id == user.id)).first()
+    stmt = delete(Contact).where(Contact.id == contact_id, Contact.user_id == user.id).returning(Contact)
+    result = await db.execute(stmt)
+    contact = result.scalar_one_or_none()
     if contact:
-        db.delete(contact)
-        db.commit()
+        await bump_contacts_version(user, db)
+        await db.commit()
+        await invalidate_contacts_cache(user)
     return contact
 
 
-async def update_contact(contact_id: int, body: ContactResponse, user: User, db: Session) -> Contact | None:
+async def update_contact(contact_id: int, body: ContactResponse, user: User, db: AsyncSession) -> Contact | None:
     """
     Update a contact for a user.
 
@@ -84,18 +206,22 @@ async def update_contact(contact_id: int, body: ContactResponse, user: User, db:
         contact_id (int): The ID of the contact to update.
         body (ContactResponse): The updated data for the contact.
         user (User): The user for whom the contact is updated.
-        db (Session): The database session.
+        db (AsyncSession): The database session.
 
     Returns:
         Contact | None: The updated contact or None if not found.
     """
-    contact = db.query(Contact).filter(and_(Contact.id == contact_id, Contact.user_id == user.id)).first()
+    stmt = (
+        update(Contact)
+        .where(Contact.id == contact_id, Contact.user_id == user.id)
+        .values(firstname=body.firstname, lastname=body.lastname, email=body.email, phone=body.phone,
+                birthdate=body.birthdate, additional_data=body.additional_data)
+        .returning(Contact)
+    )
+    result = await db.execute(stmt)
+    contact = result.scalar_one_or_none()
     if contact:
-        contact.firstname = body.firstname
-        contact.lastname = body.lastname
-        contact.email = body.email
-        contact.phone = body.phone
-        contact.birthdate = body.birthdate
-        contact.additional_data = body.additional_data
-        db.commit()
+        await bump_contacts_version(user, db)
+        await db.commit()
+        await invalidate_contacts_cache(user)
     return contact
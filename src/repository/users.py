@@ -1,68 +1,71 @@
 from libgravatar import Gravatar
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import User
 from src.schemas import UserModel
 
 
-async def get_user_by_email(email: str, db: Session) -> User:
+async def get_user_by_email(email: str, db: AsyncSession) -> User:
     """
     Retrieves a user by their email from the database.
 
     Parameters:
         email (str): The email of the user to retrieve.
-        db (Session): The database session.
+        db (AsyncSession): The database session.
 
     Returns:
         User: The user with the specified email.
     """
-    return db.query(User).filter(User.email == email).first()
+    result = await db.execute(select(User).where(User.email == email))
+    return result.scalar_one_or_none()
 
 
-async def create_user(body: UserModel, db: Session) -> User:
+async def create_user(body: UserModel, db: AsyncSession) -> User:
     """
     Creates a new user in the database.
 
     Parameters:
         body (UserModel): The user data for the new user.
-        db (Session): The database session.
+        db (AsyncSession): The database session.
 
     Returns:
         User: The newly created user.
     """
     avatar = None
+    # Gravatar only hashes the email into an image URL, no HTTP request is made here
     try:
         g = Gravatar(body.email)
         avatar = g.get_image()
     except Exception as e:
         print(e)
-    new_user = User(**body.dict(), avatar=avatar)
+    new_user = User(**body.model_dump(), avatar=avatar)
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
     return new_user
 
 
-async def update_token(user: User, token: str | None, db: Session) -> None:
+async def update_token(user: User, token: str | None, db: AsyncSession) -> None:
     """
     Updates the refresh token for a user in the database.
 
     Parameters:
         user (User): The user for whom to update the refresh token.
         token (str | None): The new refresh token.
-        db (Session): The database session.
+        db (AsyncSession): The database session.
     """
     user.refresh_token = token
-    db.commit()
+    await db.commit()
 
-async def confirmed_email(email: str, db: Session) -> None:
+async def confirmed_email(email: str, db: AsyncSession) -> None:
     """
     Marks a user's email as confirmed in the database.
 
     Parameters:
         email (str): The email of the user to confirm.
-        db (Session): The database session.
+        db (AsyncSession): The database session.
     """
     user = await get_user_by_email(email, db)
     user.confirmed = True
-    db.commit()
\ No newline at end of file
+    await db.commit()
\ No newline at end of file
@@ -2,7 +2,7 @@ from typing import List
 
 from fastapi import APIRouter, HTTPException, Depends, status, Security, BackgroundTasks, Request, UploadFile, File
 from fastapi.security import OAuth2PasswordRequestForm, HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 import cloudinary
 import cloudinary.uploader
 
@@ -20,7 +20,7 @@ security = HTTPBearer()
 
 
 @router.post("/signup", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def signup(body: UserModel, background_tasks: BackgroundTasks, request: Request, db: Session = Depends(get_db)):
+async def signup(body: UserModel, background_tasks: BackgroundTasks, request: Request, db: AsyncSession = Depends(get_db)):
     """
     Registers a new user and sends a confirmation email.
 
@@ -28,7 +28,7 @@ async def signup(body: UserModel, background_tasks: BackgroundTasks, request: Re
         body (UserModel): The user data.
         background_tasks (BackgroundTasks): Background tasks to run, including sending the confirmation email.
         request (Request): The request object.
-        db (Session): The database session.
+        db (AsyncSession): The database session.
 
     Returns:
         dict: User information and a confirmation message.
@@ -36,20 +36,20 @@ async def signup(body: UserModel, background_tasks: BackgroundTasks, request: Re
     exist_user = await repository_users.get_user_by_email(body.email, db)
     if exist_user:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Account already exists")
-    body.password = auth_service.get_password_hash(body.password)
+    body.password = await auth_service.get_password_hash(body.password)
     new_user = await repository_users.create_user(body, db)
     background_tasks.add_task(send_email, new_user.email, new_user.username, request.base_url)
     return {"user": new_user, "detail": "User successfully created. Check your email for confirmation."}
 
 
 @router.post("/login", response_model=TokenModel)
-async def login(body: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+async def login(body: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_db)):
     """
     Logs in a user and returns JWT tokens.
 
     Parameters:
         body (OAuth2PasswordRequestForm): The user login credentials.
-        db (Session): The database session.
+        db (AsyncSession): The database session.
 
     Returns:
         dict: JWT tokens.
@@ -59,7 +59,7 @@ async def login(body: OAuth2PasswordRequestForm = Depends(), db: Session = Depen
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid email")
     if not user.confirmed:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Email not confirmed")
-    if not auth_service.verify_password(body.password, user.password):
+    if not await auth_service.verify_password(body.password, user.password):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid password")
     # Generate JWT
     access_token = await auth_service.create_access_token(data={"sub": user.email})
@@ -69,13 +69,13 @@ async def login(body: OAuth2PasswordRequestForm = Depends(), db: Session = Depen
 
 
 @router.get('/refresh_token', response_model=TokenModel)
-async def refresh_token(credentials: HTTPAuthorizationCredentials = Security(security), db: Session = Depends(get_db)):
+async def refresh_token(credentials: HTTPAuthorizationCredentials = Security(security), db: AsyncSession = Depends(get_db)):
     """
     Refreshes the access token using the refresh token.
 
     Parameters:
         credentials (HTTPAuthorizationCredentials): The HTTP authorization credentials containing the refresh token.
-        db (Session): The database session.
+        db (AsyncSession): The database session.
 
     Returns:
         dict: Refreshed JWT tokens.
@@ -93,13 +93,13 @@ async def refresh_token(credentials: HTTPAuthorizationCredentials = Security(sec
     return {"access_token": access_token, "refresh_token": refresh_token, "token_type": "bearer"}
 
 @router.get('/confirmed_email/{token}')
-async def confirmed_email(token: str, db: Session = Depends(get_db)):
+async def confirmed_email(token: str, db: AsyncSession = Depends(get_db)):
     """
     Confirms a user's email address.
 
     Parameters:
         token (str): The confirmation token.
-        db (Session): The database session.
+        db (AsyncSession): The database session.
 
     Returns:
         dict: A confirmation message.
@@ -115,7 +115,7 @@ async def confirmed_email(token: str, db: Session = Depends(get_db)):
 
 @router.post('/request_email')
 async def request_email(body: RequestEmail, background_tasks: BackgroundTasks, request: Request,
-                        db: Session = Depends(get_db)):
+                        db: AsyncSession = Depends(get_db)):
     """
     Sends an email confirmation request.
 
@@ -123,7 +123,7 @@ async def request_email(body: RequestEmail, background_tasks: BackgroundTasks, r
         body (RequestEmail): The email request data.
         background_tasks (BackgroundTasks): Background tasks to run, including sending the confirmation email.
         request (Request): The request object.
-        db (Session): The database session.
+        db (AsyncSession): The database session.
 
     Returns:
         dict: A confirmation message.
@@ -152,14 +152,14 @@ async def read_users_me(current_user: User = Depends(auth_service.get_current_us
 
 @router.patch('/avatar', response_model=UserDb)
 async def update_avatar_user(file: UploadFile = File(), current_user: User = Depends(auth_service.get_current_user),
-                             db: Session = Depends(get_db)):
+                             db: AsyncSession = Depends(get_db)):
     """
     Updates the avatar of the current user.
 
     Parameters:
         file (UploadFile): The uploaded avatar file.
         current_user (User): The current authenticated user.
-        db (Session): The database session.
+        db (AsyncSession): The database session.
 
     Returns:
         UserDb: The updated user information.
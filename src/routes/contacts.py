@@ -1,47 +1,95 @@
-from typing import List
+import hashlib
+from typing import Annotated, List
 
-from fastapi import APIRouter, HTTPException, Depends, status
-from fastapi_limiter.depends import RateLimiter
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Body, HTTPException, Depends, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.db import get_db
 from src.database.models import User
-from src.schemas import ContactBase, ContactResponse, UserModel, UserDb, UserResponse, TokenModel
+from src.schemas import ContactBase, ContactResponse
 from src.repository import contacts as repository_contacts
 from src.services.auth import auth_service
+from src.services.rate_limit import RateLimiter
 
 router = APIRouter(prefix='/contacts', tags=["contacts"])
 
+CACHE_CONTROL = "private, no-cache"
+MAX_BULK_CONTACTS = 100
+
+
+def make_etag(*parts) -> str:
+    """
+    Builds a strong ETag from the values that identify a version of a resource.
+
+    Parameters:
+        parts: The values identifying the version.
+
+    Returns:
+        str: The quoted ETag.
+    """
+    return '"' + hashlib.md5(":".join(map(str, parts)).encode()).hexdigest() + '"'
+
+
+def not_modified(request: Request, response: Response, etag: str) -> bool:
+    """
+    Sets the validator headers and checks them against the request's If-None-Match header.
+
+    Parameters:
+        request (Request): The incoming request.
+        response (Response): The outgoing response.
+        etag (str): The current ETag of the resource.
+
+    Returns:
+        bool: True if the client already holds this version of the resource.
+    """
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return request.headers.get("if-none-match") == etag
+
 
 @router.get("/", response_model=List[ContactResponse], description='No more than 10 requests per minute',
-            dependencies=[Depends(RateLimiter(times=10, seconds=60))], tags=["contacts"])
-async def read_contacts(skip: int = 0, limit: int = 100, db: Session = Depends(get_db),
-                     current_user: User = Depends(auth_service.get_current_user)):
+            dependencies=[Depends(RateLimiter(times=10, seconds=60))])
+async def read_contacts(request: Request, response: Response, skip: int = 0, limit: int = 100,
+                        db: AsyncSession = Depends(get_db), current_user: User = Depends(auth_service.get_current_user)):
     """
     Retrieves a list of contacts for the current user with specified pagination parameters.
 
+    Answers with 304 Not Modified when the client's If-None-Match matches the current ETag.
+
     Parameters:
+        request (Request): The request object.
+        response (Response): The response object.
         skip (int): The number of contacts to skip.
         limit (int): The maximum number of contacts to return.
-        db (Session): The database session.
+        db (AsyncSession): The database session.
         current_user (User): The current authenticated user.
 
     Returns:
         List[ContactResponse]: A list of contacts.
     """
-    contacts = await repository_contacts.get_contacts(skip, limit, current_user, db)
+    version = await repository_contacts.get_contacts_version(current_user, db)
+    etag = make_etag(current_user.id, version)
+    if not_modified(request, response, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+    # The page is looked up under the same version as the ETag, so a cached page never outlives the ETag
+    contacts = await repository_contacts.get_contacts(skip, limit, current_user, db, version)
     return contacts
 
 
 @router.get("/{contact_id}", response_model=ContactResponse, description='No more than 10 requests per minute',
-            dependencies=[Depends(RateLimiter(times=10, seconds=60))], tags=["contacts"])
-async def read_contact(contact_id: int, db: Session = Depends(get_db), current_user: User = Depends(auth_service.get_current_user)):
+            dependencies=[Depends(RateLimiter(times=10, seconds=60))])
+async def read_contact(contact_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_db),
+                       current_user: User = Depends(auth_service.get_current_user)):
     """
     Retrieves a specific contact for the current user.
 
+    Answers with 304 Not Modified when the client's If-None-Match matches the current ETag.
+
     Parameters:
         contact_id (int): The ID of the contact to retrieve.
-        db (Session): The database session.
+        request (Request): The request object.
+        response (Response): The response object.
+        db (AsyncSession): The database session.
         current_user (User): The current authenticated user.
 
     Raises:
@@ -53,18 +101,22 @@ async def read_contact(contact_id: int, db: Session = Depends(get_db), current_u
     contact = await repository_contacts.get_contact(contact_id, current_user, db)
     if contact is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Contact not found")
+    # Built from the served fields, so any change to the contact changes the ETag
+    etag = make_etag(*(getattr(contact, field) for field in repository_contacts.CACHED_CONTACT_FIELDS))
+    if not_modified(request, response, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
     return contact
 
 
 @router.post("/", response_model=ContactResponse, status_code=status.HTTP_201_CREATED, description='No more than 10 requests per minute',
-            dependencies=[Depends(RateLimiter(times=10, seconds=60))], tags=["contacts"])
-async def create_contact(body: ContactBase, db: Session = Depends(get_db), current_user: User = Depends(auth_service.get_current_user)):
+            dependencies=[Depends(RateLimiter(times=10, seconds=60))])
+async def create_contact(body: ContactBase, db: AsyncSession = Depends(get_db), current_user: User = Depends(auth_service.get_current_user)):
     """
     Creates a new contact for the current user.
 
     Parameters:
         body (ContactBase): The data for the new contact.
-        db (Session): The database session.
+        db (AsyncSession): The database session.
         current_user (User): The current authenticated user.
 
     Returns:
@@ -73,15 +125,36 @@ async def create_contact(body: ContactBase, db: Session = Depends(get_db), curre
     return await repository_contacts.create_contact(body, current_user, db)
 
 
-@router.put("/{contact_id}", response_model=ContactResponse, tags=["contacts"])
-async def update_contact(body: ContactBase, contact_id: int, db: Session = Depends(get_db), current_user: User = Depends(auth_service.get_current_user)):
+@router.post("/bulk", response_model=List[ContactResponse], status_code=status.HTTP_201_CREATED,
+             description='No more than 10 requests per minute', dependencies=[Depends(RateLimiter(times=10, seconds=60))])
+async def create_contacts_bulk(body: Annotated[List[ContactBase], Body(max_length=MAX_BULK_CONTACTS)],
+                               db: AsyncSession = Depends(get_db),
+                               current_user: User = Depends(auth_service.get_current_user)):
+    """
+    Creates several contacts for the current user at once, e.g. when importing an address book.
+
+    A single request may carry at most MAX_BULK_CONTACTS contacts.
+
+    Parameters:
+        body (List[ContactBase]): The data for the new contacts.
+        db (AsyncSession): The database session.
+        current_user (User): The current authenticated user.
+
+    Returns:
+        List[ContactResponse]: The newly created contacts.
+    """
+    return await repository_contacts.create_contacts_bulk(body, current_user, db)
+
+
+@router.put("/{contact_id}", response_model=ContactResponse)
+async def update_contact(body: ContactBase, contact_id: int, db: AsyncSession = Depends(get_db), current_user: User = Depends(auth_service.get_current_user)):
     """
     Updates an existing contact for the current user.
 
     Parameters:
         body (ContactBase): The updated data for the contact.
         contact_id (int): The ID of the contact to update.
-        db (Session): The database session.
+        db (AsyncSession): The database session.
         current_user (User): The current authenticated user.
 
     Raises:
@@ -96,14 +169,14 @@ async def update_contact(body: ContactBase, contact_id: int, db: Session = Depen
     return contact
 
 
-@router.delete("/{contact_id}", response_model=ContactResponse, tags=["contacts"])
-async def remove_contact(contact_id: int, db: Session = Depends(get_db), current_user: User = Depends(auth_service.get_current_user)):
+@router.delete("/{contact_id}", response_model=ContactResponse)
+async def remove_contact(contact_id: int, db: AsyncSession = Depends(get_db), current_user: User = Depends(auth_service.get_current_user)):
     """
     Removes a contact for the current user.
 
     Parameters:
         contact_id (int): The ID of the contact to remove.
-        db (Session): The database session.
+        db (AsyncSession): The database session.
         current_user (User): The current authenticated user.
 
     Raises:
@@ -1,6 +1,6 @@
-from datetime import datetime
+from datetime import datetime, date
 from typing import List, Optional
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, Field, EmailStr, ConfigDict
 
 
 class ContactBase(BaseModel):
@@ -8,7 +8,7 @@ class ContactBase(BaseModel):
     lastname: str = Field(max_length=100)
     email: str = Field(max_length=100)
     phone: str = Field(max_length=100)
-    birthdate: str = Field(max_length=100)
+    birthdate: date
     additional_data: str = Field(max_length=200)
 
 
@@ -16,9 +16,7 @@ class ContactBase(BaseModel):
 class ContactResponse(ContactBase):
     id: int
 
-
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserModel(BaseModel):
@@ -34,8 +32,7 @@ class UserDb(BaseModel):
     created_at: datetime
     avatar: str
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserResponse(BaseModel):
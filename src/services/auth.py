@@ -1,17 +1,21 @@
 from typing import Optional
-import pickle
+import asyncio
 
-import redis
-from jose import JWTError, jwt
+import orjson
+from jose import JWTError, jwt, jwk
 from fastapi import HTTPException, status, Depends
 from fastapi.security import OAuth2PasswordBearer
 from passlib.context import CryptContext
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.conf.config import settings
 from src.database.db import get_db
+from src.database.models import User
 from src.repository import users as repository_users
+from src.services.cache import redis_client
+
+CACHED_USER_FIELDS = ("id", "username", "email", "created_at", "avatar", "confirmed")
 
 
 class Auth:
@@ -22,8 +26,11 @@ class Auth:
         pwd_context (CryptContext): Password hashing context.
         SECRET_KEY (str): Secret key for token encoding and decoding.
         ALGORITHM (str): Token encoding algorithm.
+        ALGORITHMS (list): Algorithms accepted when decoding tokens.
+        DECODE_OPTIONS (dict): Claim checks skipped when decoding, since the tokens never carry those claims.
+        signing_key (Key): Key object built once from SECRET_KEY and used for signing and verification.
         oauth2_scheme (OAuth2PasswordBearer): OAuth2 password bearer scheme.
-        r (Redis): Redis instance for caching user information.
+        r (Redis): Shared async Redis client for caching user information.
 
     Methods:
         verify_password(plain_password, hashed_password): Verifies a plain password against a hashed password.
@@ -31,20 +38,25 @@ class Auth:
         create_access_token(data: dict, expires_delta: Optional[float] = None): Generates a new access token.
         create_refresh_token(data: dict, expires_delta: Optional[float] = None): Generates a new refresh token.
         decode_refresh_token(refresh_token: str): Decodes and validates a refresh token, returning the associated email.
-        get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)): Retrieves the current user
+        get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)): Retrieves the current user
         based on the provided JWT token.
+        dump_user(user: User): Serializes a user into a compact cache payload.
+        load_user(payload: bytes): Rebuilds a detached user from a cache payload.
         create_email_token(data: dict): Generates a token for email verification.
         get_email_from_token(token: str): Retrieves the email from an email verification token.
     """
     pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
     SECRET_KEY = settings.secret_key
     ALGORITHM = settings.algorithm
+    ALGORITHMS = [ALGORITHM]
+    DECODE_OPTIONS = {"verify_aud": False, "verify_iss": False, "verify_jti": False, "verify_at_hash": False}
+    signing_key = jwk.construct(SECRET_KEY, ALGORITHM)
     oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
-    r = redis.Redis(host=settings.redis_host, port=settings.redis_port, db=0)
+    r = redis_client
 
-    def verify_password(self, plain_password, hashed_password):
+    async def verify_password(self, plain_password, hashed_password):
         """
-                Verifies a plain password against a hashed password.
+                Verifies a plain password against a hashed password in a worker thread.
 
                 Args:
                     plain_password (str): The plain password to be verified.
@@ -53,11 +65,11 @@ class Auth:
                 Returns:
                     bool: True if the password is valid, False otherwise.
         """
-        return self.pwd_context.verify(plain_password, hashed_password)
+        return await asyncio.to_thread(self.pwd_context.verify, plain_password, hashed_password)
 
-    def get_password_hash(self, password: str):
+    async def get_password_hash(self, password: str):
         """
-                Hashes a password using the configured context.
+                Hashes a password using the configured context in a worker thread.
 
                 Args:
                     password (str): The password to be hashed.
@@ -65,7 +77,7 @@ class Auth:
                 Returns:
                     str: The hashed password.
         """
-        return self.pwd_context.hash(password)
+        return await asyncio.to_thread(self.pwd_context.hash, password)
 
     # define a function to generate a new access token
     async def create_access_token(self, data: dict, expires_delta: Optional[float] = None):
@@ -85,7 +97,7 @@ class Auth:
         else:
             expire = datetime.utcnow() + timedelta(minutes=15)
         to_encode.update({"iat": datetime.utcnow(), "exp": expire, "scope": "access_token"})
-        encoded_access_token = jwt.encode(to_encode, self.SECRET_KEY, algorithm=self.ALGORITHM)
+        encoded_access_token = jwt.encode(to_encode, self.signing_key, algorithm=self.ALGORITHM)
         return encoded_access_token
 
     # define a function to generate a new refresh token
@@ -106,7 +118,7 @@ class Auth:
         else:
             expire = datetime.utcnow() + timedelta(days=7)
         to_encode.update({"iat": datetime.utcnow(), "exp": expire, "scope": "refresh_token"})
-        encoded_refresh_token = jwt.encode(to_encode, self.SECRET_KEY, algorithm=self.ALGORITHM)
+        encoded_refresh_token = jwt.encode(to_encode, self.signing_key, algorithm=self.ALGORITHM)
         return encoded_refresh_token
 
     async def decode_refresh_token(self, refresh_token: str):
@@ -123,7 +135,8 @@ class Auth:
                     HTTPException: If the token is invalid.
         """
         try:
-            payload = jwt.decode(refresh_token, self.SECRET_KEY, algorithms=[self.ALGORITHM])
+            payload = jwt.decode(refresh_token, self.signing_key, algorithms=self.ALGORITHMS,
+                                 options=self.DECODE_OPTIONS)
             if payload['scope'] == 'refresh_token':
                 email = payload['sub']
                 return email
@@ -131,13 +144,13 @@ class Auth:
         except JWTError:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='Could not validate credentials')
 
-    async def get_current_user(self, token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+    async def get_current_user(self, token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)):
         """
                 Retrieves the current user based on the provided JWT token.
 
                 Args:
                     token (str): The JWT token.
-                    db (Session): The database session.
+                    db (AsyncSession): The database session.
 
                 Returns:
                     User: The current user.
@@ -153,7 +166,8 @@ class Auth:
 
         try:
             # Decode JWT
-            payload = jwt.decode(token, self.SECRET_KEY, algorithms=[self.ALGORITHM])
+            payload = jwt.decode(token, self.signing_key, algorithms=self.ALGORITHMS,
+                                 options=self.DECODE_OPTIONS)
             if payload['scope'] == 'access_token':
                 email = payload["sub"]
                 if email is None:
@@ -162,17 +176,45 @@ class Auth:
                 raise credentials_exception
         except JWTError as e:
             raise credentials_exception
-        user = self.r.get(f"user:{email}")
+        user = await self.r.get(f"user:{email}")
         if user is None:
             user = await repository_users.get_user_by_email(email, db)
             if user is None:
                 raise credentials_exception
-            self.r.set(f"user:{email}", pickle.dumps(user))
-            self.r.expire(f"user:{email}", 900)
+            await self.r.set(f"user:{email}", self.dump_user(user), ex=900)
         else:
-            user = pickle.loads(user)
+            user = self.load_user(user)
         return user
 
+    @staticmethod
+    def dump_user(user: User) -> bytes:
+        """
+                Serializes the fields needed for authentication into a compact cache payload.
+
+                Args:
+                    user (User): The user to serialize.
+
+                Returns:
+                    bytes: The JSON-encoded user fields.
+        """
+        return orjson.dumps({field: getattr(user, field) for field in CACHED_USER_FIELDS})
+
+    @staticmethod
+    def load_user(payload: bytes) -> User:
+        """
+                Rebuilds a detached user from a cache payload produced by dump_user.
+
+                Args:
+                    payload (bytes): The JSON-encoded user fields.
+
+                Returns:
+                    User: A detached user instance.
+        """
+        data = orjson.loads(payload)
+        if data["created_at"] is not None:
+            data["created_at"] = datetime.fromisoformat(data["created_at"])
+        return User(**data)
+
 
     def create_email_token(self, data: dict):
         """
@@ -187,7 +229,7 @@ class Auth:
         to_encode = data.copy()
         expire = datetime.utcnow() + timedelta(days=7)
         to_encode.update({"iat": datetime.utcnow(), "exp": expire})
-        token = jwt.encode(to_encode, self.SECRET_KEY, algorithm=self.ALGORITHM)
+        token = jwt.encode(to_encode, self.signing_key, algorithm=self.ALGORITHM)
         return token
 
     async def get_email_from_token(self, token: str):
@@ -204,7 +246,8 @@ class Auth:
                     HTTPException: If the token is invalid.
         """
         try:
-            payload = jwt.decode(token, self.SECRET_KEY, algorithms=[self.ALGORITHM])
+            payload = jwt.decode(token, self.signing_key, algorithms=self.ALGORITHMS,
+                                 options=self.DECODE_OPTIONS)
             email = payload["sub"]
             return email
         except JWTError as e:
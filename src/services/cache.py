@@ -0,0 +1,8 @@
+import redis.asyncio as redis
+
+from src.conf.config import settings
+
+# A full pool makes callers wait for a free connection instead of failing with "Too many connections"
+redis_pool = redis.BlockingConnectionPool(host=settings.redis_host, port=settings.redis_port, db=0, max_connections=50,
+                                          timeout=5)
+redis_client = redis.Redis(connection_pool=redis_pool)
@@ -0,0 +1,60 @@
+import math
+import time
+
+from fastapi import HTTPException, Request, status
+
+from src.services.cache import redis_client
+
+SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+if redis.call('ZCARD', key) < limit then
+    redis.call('ZADD', key, now, ARGV[4])
+    redis.call('PEXPIRE', key, window)
+    return 0
+end
+local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+return tonumber(oldest[2]) + window - now
+"""
+
+sliding_window = redis_client.register_script(SLIDING_WINDOW_SCRIPT)
+
+
+class RateLimiter:
+    """
+    Dependency limiting how often a client may call a route within a rolling time window.
+
+    The window is kept in a Redis sorted set per client and route. Cleanup, counting and
+    registering the request run in one Lua script, so each check costs a single EVALSHA.
+
+    Attributes:
+        times (int): The number of requests allowed within the window.
+        milliseconds (int): The length of the window in milliseconds.
+    """
+
+    def __init__(self, times: int = 1, seconds: int = 0, milliseconds: int = 0):
+        self.times = times
+        self.milliseconds = milliseconds + 1000 * seconds
+
+    async def __call__(self, request: Request):
+        """
+        Registers the request and rejects it if the client is over the limit.
+
+        Args:
+            request (Request): The incoming request.
+
+        Raises:
+            HTTPException: If the client exceeded the limit for this route.
+        """
+        forwarded = request.headers.get("X-Forwarded-For")
+        ip = forwarded.split(",")[0] if forwarded else request.client.host
+        key = f"ratelimit:{ip}:{request.scope['path']}"
+        now = time.time_ns()
+        retry_after = await sliding_window(keys=[key],
+                                           args=[now // 1_000_000, self.milliseconds, self.times, now])
+        if retry_after:
+            raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail="Too Many Requests",
+                                headers={"Retry-After": str(math.ceil(retry_after / 1000))})
@@ -1,44 +1,48 @@
+import asyncio
+import os
+from contextlib import contextmanager
+
 import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import NullPool
 
-from main import app
 from src.database.models import Base
-from src.database.db import get_db
 
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+# Every pytest-xdist worker gets its own database file
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+SQLALCHEMY_DATABASE_URL = f"sqlite+aiosqlite:///./test{'_' + XDIST_WORKER if XDIST_WORKER else ''}.db"
+
+engine = create_async_engine(SQLALCHEMY_DATABASE_URL, poolclass=NullPool)
+TestingSessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+async def init_models():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
 
 
 @pytest.fixture(scope="module")
 def session():
     # Create the database
 
-    Base.metadata.drop_all(bind=engine)
-    Base.metadata.create_all(bind=engine)
-
-    db = TestingSessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+    asyncio.run(init_models())
+    yield TestingSessionLocal
 
 
 @pytest.fixture(scope="module")
 def client(session):
     # Dependency override
+    # The app is imported here so that unit tests do not pay for loading it at collection time
+    from fastapi.testclient import TestClient
+    from main import app
+    from src.database.db import get_db
 
-    def override_get_db():
-        try:
-            yield session
-        finally:
-            session.close()
+    async def override_get_db():
+        async with session() as db:
+            yield db
 
     app.dependency_overrides[get_db] = override_get_db
 
@@ -47,4 +51,24 @@ def client(session):
 
 @pytest.fixture(scope="module")
 def user():
-    return {"username": "deadpool", "email": "deadpool@example.com", "password": "123456789"}
\ No newline at end of file
+    return {"username": "deadpool", "email": "deadpool@example.com", "password": "123456789"}
+
+
+@pytest.fixture
+def count_queries():
+    # Collects every SQL statement sent to the test database inside the with block
+
+    @contextmanager
+    def counter():
+        queries = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            queries.append(statement)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield queries
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+    return counter
@@ -0,0 +1,160 @@
+import asyncio
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from sqlalchemy import update
+
+from src.database.models import Contact, User
+from src.repository.contacts import bump_contacts_version
+from src.routes.contacts import MAX_BULK_CONTACTS
+from src.services.auth import auth_service
+
+
+async def seed_contacts(session):
+    async with session() as db:
+        user = User(username="wolverine", email="wolverine@example.com", password="123456789", confirmed=True)
+        db.add(user)
+        await db.flush()
+        db.add_all([Contact(firstname=f"John{i}", lastname="Doe", email=f"john{i}@example.com", phone="1234567890",
+                            birthdate=date(2000, 1, i + 1), additional_data="", user_id=user.id) for i in range(5)])
+        await db.commit()
+        return user
+
+
+@pytest.fixture(scope="module")
+def contacts_owner(session):
+    return asyncio.run(seed_contacts(session))
+
+
+@pytest.fixture
+def authorized(client, contacts_owner, monkeypatch):
+    redis_mock = AsyncMock()
+    redis_mock.get.return_value = None
+    redis_mock.pipeline = MagicMock()
+    redis_mock.pipeline.return_value.execute = AsyncMock()
+    monkeypatch.setattr("src.repository.contacts.redis_client", redis_mock)
+    monkeypatch.setattr("src.services.rate_limit.sliding_window", AsyncMock(return_value=0))
+    monkeypatch.setitem(client.app.dependency_overrides, auth_service.get_current_user, lambda: contacts_owner)
+
+
+def test_read_contacts_no_n_plus_1(client, authorized, count_queries):
+    with count_queries() as queries:
+        response = client.get("/api/contacts/")
+    assert response.status_code == 200, response.text
+    assert len(response.json()) == 5
+    # ETag version query, the page itself and the batched load of the owners
+    assert len(queries) <= 3, queries
+
+
+def test_create_contacts_bulk(client, authorized):
+    contacts = [{"firstname": f"Jane{i}", "lastname": "Doe", "email": f"jane{i}@example.com", "phone": "1234567890",
+                 "birthdate": "1999-12-31", "additional_data": ""} for i in range(3)]
+    response = client.post("/api/contacts/bulk", json=contacts)
+    assert response.status_code == 201, response.text
+    data = response.json()
+    assert [contact["firstname"] for contact in data] == ["Jane0", "Jane1", "Jane2"]
+    assert all("id" in contact for contact in data)
+
+
+def test_create_contacts_bulk_too_many(client, authorized):
+    contact = {"firstname": "Jane", "lastname": "Doe", "email": "jane@example.com", "phone": "1234567890",
+               "birthdate": "1999-12-31", "additional_data": ""}
+    response = client.post("/api/contacts/bulk", json=[contact] * (MAX_BULK_CONTACTS + 1))
+    assert response.status_code == 422, response.text
+
+
+def test_read_contacts_not_modified(client, authorized):
+    response = client.get("/api/contacts/")
+    assert response.status_code == 200, response.text
+    etag = response.headers["ETag"]
+    assert response.headers["Cache-Control"] == "private, no-cache"
+
+    response = client.get("/api/contacts/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+    client.post("/api/contacts/", json={"firstname": "Logan", "lastname": "Howlett", "email": "logan@example.com",
+                                        "phone": "1234567890", "birthdate": "1980-02-02", "additional_data": ""})
+    response = client.get("/api/contacts/", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_read_contact_not_modified(client, authorized):
+    contact_id = client.get("/api/contacts/").json()[0]["id"]
+    response = client.get(f"/api/contacts/{contact_id}")
+    assert response.status_code == 200, response.text
+    etag = response.headers["ETag"]
+
+    response = client.get(f"/api/contacts/{contact_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+async def touch_contact_without_invalidation(session, owner, contact_id):
+    # A committed write whose cache invalidation has not run yet
+    async with session() as db:
+        await db.execute(update(Contact).where(Contact.id == contact_id).values(firstname="Changed"))
+        await bump_contacts_version(owner, db)
+        await db.commit()
+
+
+def test_read_contacts_cached_page_follows_etag(client, authorized, session, contacts_owner, monkeypatch):
+    redis = FakeAsyncRedis()
+    monkeypatch.setattr("src.repository.contacts.redis_client", redis)
+    # One event loop for every request, since the fake Redis is bound to the loop that first uses it
+    with client as loop_client:
+        response = loop_client.get("/api/contacts/")
+        assert response.status_code == 200, response.text
+        etag = response.headers["ETag"]
+        contact_id = response.json()[0]["id"]
+        assert loop_client.portal.call(redis.keys, "contacts:*:0:100")
+
+        asyncio.run(touch_contact_without_invalidation(session, contacts_owner, contact_id))
+
+        response = loop_client.get("/api/contacts/", headers={"If-None-Match": etag})
+        assert response.status_code == 200, response.text
+        assert response.headers["ETag"] != etag
+        assert response.json()[0]["firstname"] == "Changed"
+
+
+def test_update_contact_changes_etags(client, authorized):
+    response = client.get("/api/contacts/")
+    list_etag = response.headers["ETag"]
+    contact = response.json()[1]
+    contact_etag = client.get(f"/api/contacts/{contact['id']}").headers["ETag"]
+
+    body = {field: value for field, value in contact.items() if field != "id"} | {"phone": "0987654321"}
+    response = client.put(f"/api/contacts/{contact['id']}", json=body)
+    assert response.status_code == 200, response.text
+
+    response = client.get("/api/contacts/", headers={"If-None-Match": list_etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != list_etag
+    response = client.get(f"/api/contacts/{contact['id']}", headers={"If-None-Match": contact_etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != contact_etag
+    assert response.json()["phone"] == "0987654321"
+
+
+def test_remove_contact_changes_etag(client, authorized):
+    response = client.get("/api/contacts/")
+    list_etag = response.headers["ETag"]
+    contact_id = response.json()[-1]["id"]
+
+    response = client.delete(f"/api/contacts/{contact_id}")
+    assert response.status_code == 200, response.text
+
+    response = client.get("/api/contacts/", headers={"If-None-Match": list_etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != list_etag
+    assert contact_id not in [contact["id"] for contact in response.json()]
+    assert client.get(f"/api/contacts/{contact_id}").status_code == 404
+
+
+def test_contacts_openapi_tags(client):
+    operations = [operation for path, item in client.app.openapi()["paths"].items()
+                  if path.startswith("/api/contacts") for operation in item.values()]
+    assert operations
+    assert all(operation["tags"] == ["contacts"] for operation in operations)
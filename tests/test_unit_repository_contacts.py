@@ -1,7 +1,9 @@
 import unittest
-from unittest.mock import MagicMock
+from datetime import date
+from unittest.mock import MagicMock, AsyncMock, patch
 
-from sqlalchemy.orm import Session
+import orjson
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import Contact, User
 from src.schemas import ContactBase, ContactResponse, UserModel, UserDb, UserResponse
@@ -9,72 +11,155 @@ from src.repository.contacts import (
     get_contacts,
     get_contact,
     create_contact,
+    create_contacts_bulk,
     remove_contact,
     update_contact,
 )
 
+VERSION = 3
+PAGE_KEY = "contacts:1:3:0:10"
+
 
 class TestContacts(unittest.IsolatedAsyncioTestCase):
 
     def setUp(self):
-        self.session = MagicMock(spec=Session)
+        self.session = MagicMock(spec=AsyncSession)
+        self.result = MagicMock()
+        self.session.execute.return_value = self.result
         self.user = User(id=1)
+        self.redis = AsyncMock()
+        self.redis.get.return_value = None
+        self.redis.smembers.return_value = {PAGE_KEY.encode()}
+        self.redis.pipeline = MagicMock()
+        self.redis.pipeline.return_value.execute = AsyncMock()
+        patcher = patch('src.repository.contacts.redis_client', self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def assert_version_bumped(self):
+        stmt = self.session.execute.call_args.args[0]
+        self.assertTrue(stmt.is_update)
+        self.assertEqual(stmt.table.name, "users")
+        self.assertEqual(stmt.compile().params, {"contacts_version_1": 1, "id_1": self.user.id})
 
     async def test_get_contacts(self):
         contacts = [Contact(), Contact(), Contact()]
-        self.session.query().filter().offset().limit().all.return_value = contacts
-        result = await get_contacts(skip=0, limit=10, user=self.user, db=self.session)
+        self.result.scalars.return_value.all.return_value = contacts
+        result = await get_contacts(skip=0, limit=10, user=self.user, db=self.session, version=VERSION)
         self.assertEqual(result, contacts)
+        self.redis.get.assert_called_once_with(PAGE_KEY)
+        self.redis.pipeline.return_value.set.assert_called_once()
+        self.redis.pipeline.return_value.sadd.assert_called_once_with("contacts:1:keys", PAGE_KEY)
+
+    async def test_get_contacts_looks_up_version(self):
+        self.result.scalar_one.return_value = VERSION
+        self.result.scalars.return_value.all.return_value = []
+        await get_contacts(skip=0, limit=10, user=self.user, db=self.session)
+        self.assertEqual(self.session.execute.call_count, 2)
+        self.redis.get.assert_called_once_with(PAGE_KEY)
+
+    async def test_get_contacts_new_version_misses_cache(self):
+        self.result.scalars.return_value.all.return_value = []
+        await get_contacts(skip=0, limit=10, user=self.user, db=self.session, version=4)
+        self.redis.get.assert_called_once_with("contacts:1:4:0:10")
+        self.session.execute.assert_called_once()
+
+    async def test_get_contacts_cached(self):
+        self.redis.get.return_value = orjson.dumps([{"id": 5, "firstname": "John", "birthdate": "2000-01-01",
+                                                    "user_id": 1}])
+        result = await get_contacts(skip=0, limit=10, user=self.user, db=self.session, version=VERSION)
+        self.session.execute.assert_not_called()
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0].id, 5)
+        self.assertEqual(result[0].firstname, "John")
+        self.assertEqual(result[0].birthdate, date(2000, 1, 1))
 
     async def test_get_contact_found(self):
         contact = Contact()
-        self.session.query().filter().first.return_value = contact
+        self.result.scalar_one_or_none.return_value = contact
         result = await get_contact(contact_id=1, user=self.user, db=self.session)
         self.assertEqual(result, contact)
 
     async def test_get_contact_not_found(self):
-        self.session.query().filter().first.return_value = None
+        self.result.scalar_one_or_none.return_value = None
         result = await get_contact(contact_id=1, user=self.user, db=self.session)
         self.assertIsNone(result)
 
     async def test_create_contact(self):
         body = ContactBase(firstname="John", lastname="Doe", email="john.doe@example.com", phone="1234567890",
                            birthdate="2000-01-01", additional_data="2000-01-01", user_id="id")
-        contact = Contact()
-        self.session.query(Contact).filter().all.return_value = [contact]
+        self.result.scalar_one.return_value = Contact(id=1, user_id=self.user.id, **body.model_dump())
         result = await create_contact(body=body, user=self.user, db=self.session)
-        self.assertEqual(result.firstname, body.firstname)
-        self.assertEqual(result.lastname, body.lastname)
-        self.assertEqual(result.email, body.email)
-        self.assertEqual(result.phone, body.phone)
-        self.assertEqual(result.birthdate, body.birthdate)
-        self.assertEqual(result.additional_data, body.additional_data)
-        self.assertTrue(hasattr(result, "id"))
+        self.assertEqual(result, self.result.scalar_one.return_value)
+        self.assertEqual(self.session.execute.call_count, 2)
+        stmt = self.session.execute.call_args_list[0].args[0]
+        self.assertTrue(stmt.is_insert)
+        self.assertEqual(stmt.compile().params, body.model_dump() | {"user_id": self.user.id})
+        self.assert_version_bumped()
+        self.redis.delete.assert_called_once_with("contacts:1:keys", PAGE_KEY.encode())
+
+    async def test_create_contacts_bulk(self):
+        bodies = [ContactBase(firstname=f"John{i}", lastname="Doe", email="john.doe@example.com", phone="1234567890",
+                              birthdate="2000-01-01", additional_data="") for i in range(3)]
+        contacts = [Contact(id=i, user_id=self.user.id, **body.model_dump()) for i, body in enumerate(bodies)]
+        scalars_result = MagicMock()
+        scalars_result.all.return_value = contacts
+        self.session.scalars.return_value = scalars_result
+        result = await create_contacts_bulk(bodies=bodies, user=self.user, db=self.session)
+        self.assertEqual(result, contacts)
+        self.session.scalars.assert_called_once()
+        self.assertEqual(self.session.scalars.call_args.args[1][0]["user_id"], self.user.id)
+        self.assert_version_bumped()
+        self.session.commit.assert_called_once()
+        self.redis.delete.assert_called_once()
+
+    async def test_create_contacts_bulk_empty(self):
+        result = await create_contacts_bulk(bodies=[], user=self.user, db=self.session)
+        self.assertEqual(result, [])
+        self.session.scalars.assert_not_called()
 
     async def test_remove_contact_found(self):
         contact = Contact()
-        self.session.query().filter().first.return_value = contact
-        result = await remove_contact(contact_id=1, user=self.user, db=self.session)
+        self.result.scalar_one_or_none.return_value = contact
+        result = await remove_contact(contact_id=3, user=self.user, db=self.session)
         self.assertEqual(result, contact)
+        self.assertEqual(self.session.execute.call_count, 2)
+        stmt = self.session.execute.call_args_list[0].args[0]
+        self.assertTrue(stmt.is_delete)
+        self.assertEqual(stmt.compile().params, {"id_1": 3, "user_id_1": self.user.id})
+        self.assert_version_bumped()
+        self.session.commit.assert_called_once()
 
     async def test_remove_contact_not_found(self):
-        self.session.query().filter().first.return_value = None
+        self.result.scalar_one_or_none.return_value = None
         result = await remove_contact(contact_id=1, user=self.user, db=self.session)
         self.assertIsNone(result)
+        self.session.execute.assert_called_once()
+        self.session.commit.assert_not_called()
+        self.redis.delete.assert_not_called()
 
     async def test_update_contact_found(self):
         body = ContactBase(firstname="John", lastname="Doe", email="john.doe@example.com", phone="1234567890",
                            birthdate="2000-01-01", additional_data="2000-01-01", user_id="id")
-        contact = Contact()
-        self.session.query(Contact).filter().all.return_value = [contact]
+        contact = Contact(id=3, user_id=self.user.id, **body.model_dump())
+        self.result.scalar_one_or_none.return_value = contact
+        result = await update_contact(contact_id=3, body=body, user=self.user, db=self.session)
+        self.assertEqual(result, contact)
+        self.assertEqual(self.session.execute.call_count, 2)
+        stmt = self.session.execute.call_args_list[0].args[0]
+        self.assertTrue(stmt.is_update)
+        self.assertEqual(stmt.compile().params, body.model_dump() | {"id_1": 3, "user_id_1": self.user.id})
+        self.assert_version_bumped()
+        self.session.commit.assert_called_once()
+
+    async def test_update_contact_not_found(self):
+        body = ContactBase(firstname="John", lastname="Doe", email="john.doe@example.com", phone="1234567890",
+                           birthdate="2000-01-01", additional_data="2000-01-01")
+        self.result.scalar_one_or_none.return_value = None
         result = await update_contact(contact_id=1, body=body, user=self.user, db=self.session)
-        self.assertEqual(result.firstname, body.firstname)
-        self.assertEqual(result.lastname, body.lastname)
-        self.assertEqual(result.email, body.email)
-        self.assertEqual(result.phone, body.phone)
-        self.assertEqual(result.birthdate, body.birthdate)
-        self.assertEqual(result.additional_data, body.additional_data)
-        self.assertTrue(hasattr(result, "id"))
+        self.assertIsNone(result)
+        self.session.execute.assert_called_once()
+        self.session.commit.assert_not_called()
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,62 +1,105 @@
-import unittest
-from unittest.mock import MagicMock, patch
-from sqlalchemy.orm import Session
-from src.repository.users import get_user_by_email, create_user, update_token, confirmed_email
-from src.database.models import User
-from src.schemas import UserModel
+import importlib
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch, create_autospec, call
 
+import pytest
 
-class TestUserRepository(unittest.IsolatedAsyncioTestCase):
-    def setUp(self):
-        self.session = MagicMock(spec=Session)
-        self.user = User(id=1)
+# All tests share one event loop, like the shared asyncio.Runner they replaced
+pytestmark = [pytest.mark.xdist_group("unit_repo_users"), pytest.mark.asyncio(scope="module")]
 
-    @patch('src.repository.users.Gravatar')
-    async def test_create_user(self, mock_gravatar):
+
+@pytest.fixture(scope="module")
+def users():
+    # Imported here so that collecting or deselecting these tests does not load the app modules
+    return importlib.import_module('src.repository.users')
+
+
+@pytest.fixture(scope="module")
+def user_cls():
+    from src.database.models import User
+    return User
+
+
+@pytest.fixture(scope="module")
+def user_model():
+    from src.schemas import UserModel
+    return UserModel(username="testuser", email="test@example.com", password="testpassword")
+
+
+@pytest.fixture(scope="module")
+def gravatar_patch(users):
+    with patch.object(users, 'Gravatar') as mock_gravatar:
         mock_gravatar.return_value.get_image.return_value = "mocked_avatar_url"
-        user_model = UserModel(username="testuser", email="test@example.com", password="testpassword")
-        db_session = MagicMock(spec=Session)
+        yield mock_gravatar
+
+
+@pytest.fixture(scope="module")
+def user_autospec(user_cls):
+    return create_autospec(user_cls)
+
+
+@pytest.fixture(scope="module")
+def mock_pool(user_cls):
+    from sqlalchemy.ext.asyncio import AsyncSession
+    return {"session": MagicMock(spec=AsyncSession), "result": MagicMock(), "user": MagicMock(spec=user_cls),
+            "get_user_by_email": AsyncMock()}
+
+
+@pytest.fixture
+def pool(mock_pool, gravatar_patch, user_autospec):
+    # The module-wide mocks are reset before every test, keeping the configured avatar URL and the autospec
+    for mock in mock_pool.values():
+        mock.reset_mock(return_value=True, side_effect=True)
+    gravatar_patch.reset_mock(return_value=False, side_effect=False)
+    user_autospec.reset_mock()
+    mock_pool["session"].execute.return_value = mock_pool["result"]
+    return mock_pool
+
+
+@pytest.fixture
+def session(pool):
+    return pool["session"]
+
 
-        with patch('src.repository.users.User', spec=User) as mock_user:
-            result = await create_user(user_model, db_session)
+async def test_create_user(users, user_model, gravatar_patch, user_autospec, session):
+    with patch.object(users, 'User', new=user_autospec) as mock_user:
+        result = await users.create_user(user_model, session)
 
-        mock_gravatar.assert_called_once_with(user_model.email)
-        mock_gravatar.return_value.get_image.assert_called_once()
-        mock_user.assert_called_once_with(username=user_model.username, email=user_model.email,
-                                          password=user_model.password, avatar="mocked_avatar_url")
+    assert gravatar_patch.mock_calls == [call(user_model.email), call().get_image()]
+    assert mock_user.mock_calls == [call(username=user_model.username, email=user_model.email,
+                                         password=user_model.password, avatar="mocked_avatar_url")]
+    assert session.mock_calls == [call.add(mock_user.return_value), call.commit(),
+                                  call.refresh(mock_user.return_value)]
 
-        db_session.add.assert_called_once_with(mock_user.return_value)
-        db_session.commit.assert_called_once()
-        db_session.refresh.assert_called_once_with(mock_user.return_value)
+    assert result == mock_user.return_value
 
-        self.assertEqual(result, mock_user.return_value)
 
-    async def test_get_user_by_email(self):
-        user = User()
-        self.session.query().filter().first.return_value = user
-        result = await get_user_by_email(email="test@example.com", db=self.session)
-        self.assertEqual(result, user)
+async def test_get_user_by_email(users, user_cls, session):
+    user = user_cls.__new__(user_cls)
+    session.execute.return_value.scalar_one_or_none.return_value = user
+    result = await users.get_user_by_email(email="test@example.com", db=session)
+    assert result == user
+    stmt = session.execute.call_args.args[0]
+    assert stmt.column_descriptions[0]["entity"] == user_cls
+    assert list(stmt.compile().params.values()) == ["test@example.com"]
 
-    async def test_update_token(self):
-        user = MagicMock(spec=User)
-        token = "new_token"
-        db_session = MagicMock(spec=Session)
 
-        await update_token(user, token, db_session)
+async def test_update_token(users, pool, session):
+    user = pool["user"]
+    token = "new_token"
 
-        self.assertEqual(user.refresh_token, token)
-        db_session.commit.assert_called_once()
+    await users.update_token(user, token, session)
 
-    @patch('src.repository.users.get_user_by_email', return_value=MagicMock(confirmed=False))
-    async def test_confirmed_email(self, mock_get_user):
-        email = "test@example.com"
-        db_session = MagicMock(spec=Session)
+    assert user.refresh_token == token
+    session.commit.assert_called_once()
 
-        await confirmed_email(email, db_session)
 
-        mock_get_user.assert_called_once_with(email, db_session)
-        self.assertTrue(mock_get_user.return_value.confirmed)
+async def test_confirmed_email(users, pool, session):
+    email = "test@example.com"
+    pool["get_user_by_email"].return_value = SimpleNamespace(confirmed=False)
 
+    with patch.object(users, 'get_user_by_email', new=pool["get_user_by_email"]) as mock_get_user:
+        await users.confirmed_email(email, session)
 
-if __name__ == '__main__':
-    unittest.main()
+    mock_get_user.assert_called_once_with(email, session)
+    assert mock_get_user.return_value.confirmed
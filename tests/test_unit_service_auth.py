@@ -0,0 +1,43 @@
+import unittest
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models import User
+from src.services.auth import auth_service
+
+
+class TestAuthUserCache(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.user = User(id=1, username="deadpool", email="deadpool@example.com", password="hashed",
+                         created_at=datetime(2024, 1, 2, 3, 4, 5), avatar="avatar_url", confirmed=True)
+        self.session = MagicMock(spec=AsyncSession)
+        self.redis = AsyncMock()
+        patcher = patch.object(auth_service, 'r', self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_dump_load_roundtrip(self):
+        result = auth_service.load_user(auth_service.dump_user(self.user))
+        self.assertIsInstance(result, User)
+        self.assertEqual(result.id, self.user.id)
+        self.assertEqual(result.username, self.user.username)
+        self.assertEqual(result.email, self.user.email)
+        self.assertEqual(result.created_at, self.user.created_at)
+        self.assertEqual(result.avatar, self.user.avatar)
+        self.assertTrue(result.confirmed)
+        self.assertIsNone(result.password)
+
+    async def test_get_current_user_cache_hit(self):
+        self.redis.get.return_value = auth_service.dump_user(self.user)
+        token = await auth_service.create_access_token(data={"sub": self.user.email})
+        with patch('src.services.auth.repository_users.get_user_by_email') as mock_get_user:
+            result = await auth_service.get_current_user(token, self.session)
+        mock_get_user.assert_not_called()
+        self.redis.get.assert_awaited_once_with(f"user:{self.user.email}")
+        self.assertEqual(result.email, self.user.email)
+        self.assertEqual(result.created_at, self.user.created_at)
+        self.assertIsNone(inspect(result).session)
@@ -0,0 +1,59 @@
+import unittest
+from unittest.mock import patch
+
+from fakeredis import FakeAsyncRedis
+from fastapi import HTTPException, status
+from starlette.requests import Request
+
+import src.services.rate_limit as rate_limit
+from src.services.rate_limit import RateLimiter, SLIDING_WINDOW_SCRIPT
+
+START_NS = 1_700_000_000 * 10 ** 9
+
+
+def make_request(path="/api/contacts/", host="10.0.0.1", headers=()):
+    return Request({"type": "http", "method": "GET", "path": path, "headers": list(headers),
+                    "client": (host, 12345)})
+
+
+class TestRateLimiter(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.redis = FakeAsyncRedis()
+        patcher = patch.object(rate_limit, 'sliding_window', self.redis.register_script(SLIDING_WINDOW_SCRIPT))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.limiter = RateLimiter(times=2, seconds=10)
+
+    async def asyncTearDown(self):
+        await self.redis.close()
+
+    async def call_at(self, seconds, request=None):
+        with patch.object(rate_limit.time, 'time_ns', return_value=START_NS + int(seconds * 10 ** 9)):
+            await self.limiter(request or make_request())
+
+    async def test_allows_requests_within_limit(self):
+        await self.call_at(0)
+        await self.call_at(1)
+        self.assertEqual(await self.redis.zcard("ratelimit:10.0.0.1:/api/contacts/"), 2)
+
+    async def test_rejects_request_over_limit(self):
+        await self.call_at(0)
+        await self.call_at(1)
+        with self.assertRaises(HTTPException) as cm:
+            await self.call_at(4)
+        self.assertEqual(cm.exception.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        # The oldest request leaves the window 10s after it was made, 6s from now
+        self.assertEqual(cm.exception.headers["Retry-After"], "6")
+        self.assertEqual(await self.redis.zcard("ratelimit:10.0.0.1:/api/contacts/"), 2)
+
+    async def test_allows_request_once_window_slides(self):
+        await self.call_at(0)
+        await self.call_at(1)
+        await self.call_at(10.5)
+
+    async def test_limits_per_forwarded_client(self):
+        await self.call_at(0)
+        await self.call_at(1)
+        await self.call_at(2, make_request(headers=[(b"x-forwarded-for", b"192.168.1.5, 10.0.0.1")]))
+        self.assertEqual(await self.redis.zcard("ratelimit:192.168.1.5:/api/contacts/"), 1)